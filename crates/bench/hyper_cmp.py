@@ -1,15 +1,10 @@
 # Mini-tool for comparing benchmark between PR or locally
-import os
 import json
 import argparse
 import subprocess
 import shutil
 
 
-def statDecoder(statDict):
-    return namedtuple('Stat', statDict.keys())(*statDict.values())
-
-
 def clean(stat):
     new = {}
     for (k, v) in stat.items():
@@ -24,7 +19,7 @@ def clean(stat):
 
 
 def larger(row: list):
-    return [len(str(x)) for x in row]
+    return max(len(str(x)) for x in row)
 
 
 def bar_chart(data: list):
@@ -34,37 +29,23 @@ def bar_chart(data: list):
     longest_label_length = max(len(label) for label, _ in data.items())
 
     for label, count in data.items():
+        # Whole cells only: the chart is pasted into a markdown code block,
+        # where plain ASCII renders the same everywhere.
+        bar = '#' * round(count / increment)
 
-        # The ASCII block elements come in chunks of 8, so we work out how
-        # many fractions of 8 we need.
-        # https://en.wikipedia.org/wiki/Block_Elements
-        bar_chunks, remainder = divmod(int(count * 8 / increment), 8)
-
-        # First draw the full width chunks
-        bar = '█' * bar_chunks
-
-        # Then add the fractional part.  The Unicode code points for
-        # block elements are (8/8), (7/8), (6/8), ... , so we need to
-        # work backwards.
-        if remainder > 0:
-            bar += chr(ord('█') + (8 - remainder))
+        # If the bar is empty, still show a tick
+        bar = bar or '|'
 
-        # If the bar is empty, add a left one-eighth block
-        bar = bar or '▏'
-
-        print(f'{label.rjust(longest_label_length)} ▏ {count:#4f} {bar}')
+        print(f'{label.rjust(longest_label_length)} | {count:#4f} {bar}')
 
 
 class Report:
     def __init__(self, title: str, header: list, bar: dict, rows: dict):
         self.title = title
-        size = larger(header)
-        for row in rows:
-            size = size + larger(row)
         self.header = header
         self.bar = bar
         self.rows = rows
-        self.larger = max(size) + 2
+        self.larger = max(larger(row) for row in (header, *rows)) + 2
 
 
 class Stat:
@@ -74,23 +55,12 @@ class Stat:
 
 
 def load_file(named: str):
-    data = open(named).read()
-    return Stat(json.loads(data)['results'])
-
-
-def print_cell(cell: str, size: int, is_last: bool):
-    spaces = " " * (size - len(cell))
-    if is_last:
-        return "| %s%s |" % (cell, spaces)
-    else:
-        return "| %s%s " % (cell, spaces)
+    with open(named) as file:
+        return Stat(json.load(file)['results'])
 
 
 def print_row(row: list, size: int):
-    line = ""
-    for (pos, x) in enumerate(row):
-        line += print_cell(str(x), size, pos + 1 == len(row))
-    print(line)
+    print("| " + " | ".join(f"{str(x):<{size}}" for x in row) + " |")
 
 
 def print_mkdown(report: Report):
@@ -155,18 +125,18 @@ if __name__ == '__main__':
     args = vars(parser.parse_args())
 
     # args = {"bench": "pr"}
-    cmd = "./hyperfine.sh insert"
+    cmd = ["./hyperfine.sh", "insert"]
     if args["bench"] == "pr":
-        subprocess.check_call('./pr_copy.sh "%s"' % cmd, shell=True)
+        subprocess.check_call(["./pr_copy.sh", " ".join(cmd)])
 
-        subprocess.check_call(cmd, shell=True, timeout=60 * 5)
+        subprocess.check_call(cmd, timeout=60 * 5)
         shutil.copyfile("out.json", "new.json")
 
         old = load_file("old.json")
         new = load_file("new.json")
         report = improvement_bench(old, new)
     else:
-        subprocess.check_call(cmd, shell=True, timeout=60 * 5)
+        subprocess.check_call(cmd, timeout=60 * 5)
 
         stat = load_file("out.json")
         report = cmp_bench(stat)
@@ -1,20 +1,22 @@
-import glob
+import io
 import os
 import yaml
 from dataclasses import dataclass
+from pathlib import Path
 import shutil
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 base = os.path.dirname(__file__)
 standard = os.path.join(base, 'standards', '2016')
-tests_paths = glob.glob(os.path.join(standard, '**', '*.tests.yml'), recursive=True)
 output_path = os.path.join(base, 'test', 'sql_2016')
 
-shutil.rmtree(output_path)
-os.mkdir(output_path)
-
 mandatory = {}
-with open(os.path.join(standard, 'features.yml'), 'r') as file:
-    document = next(yaml.safe_load_all(file))
+with open(os.path.join(standard, 'features.yml'), 'rb') as file:
+    document = next(yaml.load_all(file, Loader=SafeLoader))
 
     mandatory = document['mandatory']
 
@@ -108,24 +110,26 @@ def write_sql(file: file, data: Test):
     sql = ";\n".join(data.sql)
     file.write(fix_sql(sql))
 
+# The `.slt` content of each output file, written once all the tests are read
+OUTPUTS: dict[str, io.StringIO] = {}
+
+
 def generate(data: Test):
     file_name = data.feature.replace("-", "_") + ".slt"
     file_name = os.path.join(output_path, file_name)
     print(file_name)
-    if os.path.exists(file_name):
-        with open(file_name, 'a') as file:
-            write_sql(file, data)
-    else:
-        with open(file_name, 'w') as file:
-            file.write("# %s: %s\n" % (data.feature, data.desc))
-            write_sql(file, data)
-
-
-total = 0
-for file_path in tests_paths:
-    print(file_path)
-    with open(file_path, 'r') as file:
-        documents = yaml.safe_load_all(file)
+    file = OUTPUTS.get(file_name)
+    if file is None:
+        file = OUTPUTS[file_name] = io.StringIO()
+        file.write("# %s: %s\n" % (data.feature, data.desc))
+    write_sql(file, data)
+
+
+# Parse one `*.tests.yml` file, keeping only the tests of mandatory features
+def load_tests(file_path: Path):
+    tests = []
+    with open(file_path, 'rb') as file:
+        documents = yaml.load_all(file, Loader=SafeLoader)
         for row in documents:
             # print(row)
             # print("\n")
@@ -135,7 +139,42 @@ for file_path in tests_paths:
             else:
                 continue
 
-            t = Test(feature=feature, id=row['id'], sql=row['sql'],  desc=desc)
+            tests.append(Test(feature=feature, id=row['id'], sql=row['sql'],  desc=desc))
+    return tests
+
+
+# Sync `output_path` with `OUTPUTS`, only touching the files whose content changed
+# so an unchanged run leaves the tree (and its mtimes) alone.
+def write_outputs():
+    os.makedirs(output_path, exist_ok=True)
+
+    for file_name in os.listdir(output_path):
+        file_name = os.path.join(output_path, file_name)
+        if file_name not in OUTPUTS:
+            if os.path.isdir(file_name):
+                shutil.rmtree(file_name)
+            else:
+                os.remove(file_name)
+
+    for file_name, file in OUTPUTS.items():
+        content = file.getvalue()
+        if os.path.exists(file_name):
+            with open(file_name, 'r') as old:
+                if old.read() == content:
+                    continue
+        tmp_name = file_name + ".tmp"
+        with open(tmp_name, 'w') as out:
+            out.write(content)
+        os.replace(tmp_name, file_name)
+
+
+if __name__ == '__main__':
+    total = 0
+    for file_path in Path(standard).rglob('*.tests.yml'):
+        print(file_path)
+        for t in load_tests(file_path):
             generate(t)
             total += 1
-print(total)
+
+    write_outputs()
+    print(total)
@@ -82,12 +82,13 @@ cargo run build "$RESET_PROJECT_PATH" -s -d
 export SPACETIME_SKIP_CLIPPY=1
 
 if [ -z "${NO_DOCKER:-}" ] ; then
-	if [ "$(docker ps | grep "node" -c)" != 1 ] ; then
+	# Let the daemon filter the running containers by name, and list only the
+	# names, which serve both the check and the lookup.
+	CONTAINER_NAME="$(docker ps --filter "name=node" --format '{{.Names}}' || true)"
+	if [ "$(grep -c . <<< "$CONTAINER_NAME")" != 1 ] ; then
 		echo "Docker container not found, is SpacetimeDB running?"
 		exit 1
 	fi
-
-	CONTAINER_NAME=$(docker ps | grep "node" | awk '{print $NF}')
 	docker logs "$CONTAINER_NAME"
 fi
 
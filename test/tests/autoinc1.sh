@@ -10,7 +10,8 @@ set -euox pipefail
 source "./test/lib.include"
 
 do_test() {
-  echo "RUNNING TEST FOR VALUE: $1"
+  local int_ty=$1
+  echo "RUNNING TEST FOR VALUE: $int_ty"
   reset_project
 
   cat > "${PROJECT_PATH}/src/lib.rs" << EOF
@@ -19,12 +20,12 @@ use spacetimedb::{println, spacetimedb};
 #[spacetimedb(table)]
 pub struct Person {
     #[autoinc]
-    key_col: REPLACE_VALUE,
+    key_col: ${int_ty},
     name: String,
 }
 
 #[spacetimedb(reducer)]
-pub fn add(name: String, expected_value: REPLACE_VALUE) {
+pub fn add(name: String, expected_value: ${int_ty}) {
     let value = Person::insert(Person { key_col: 0, name });
     assert_eq!(value.key_col, expected_value);
 }
@@ -38,8 +39,6 @@ pub fn say_hello() {
 }
 EOF
 
-  fsed "s/REPLACE_VALUE/$1/g" "${PROJECT_PATH}/src/lib.rs"
-
   run_test cargo run publish --project-path "$PROJECT_PATH" --clear-database --skip_clippy
   [ "1" == "$(grep -c "reated new database" "$TEST_OUT")" ]
   IDENT="$(grep "reated new database" "$TEST_OUT" | awk 'NF>1{print $NF}')"
@@ -10,7 +10,8 @@ set -euox pipefail
 source "./test/lib.include"
 
 do_test() {
-  echo "RUNNING TEST FOR VALUE: $1"
+  local int_ty=$1
+  echo "RUNNING TEST FOR VALUE: $int_ty"
   reset_project
 
   cat > "${PROJECT_PATH}/src/lib.rs" << EOF
@@ -21,7 +22,7 @@ use spacetimedb::{println, spacetimedb};
 pub struct Person {
     #[autoinc]
     #[unique]
-    key_col: REPLACE_VALUE,
+    key_col: ${int_ty},
     #[unique]
     name: String,
 }
@@ -34,7 +35,7 @@ pub fn add_new(name: String) -> Result<(), Box<dyn Error>> {
 }
 
 #[spacetimedb(reducer)]
-pub fn update(name: String, new_id: REPLACE_VALUE) {
+pub fn update(name: String, new_id: ${int_ty}) {
     Person::delete_by_name(&name);
     let _value = Person::insert(Person { key_col: new_id, name });
 }
@@ -48,8 +49,6 @@ pub fn say_hello() {
 }
 EOF
 
-  fsed "s/REPLACE_VALUE/$1/g" "${PROJECT_PATH}/src/lib.rs"
-
   run_test cargo run publish --project-path "$PROJECT_PATH" --clear-database
   [ "1" == "$(grep -c "reated new database" "$TEST_OUT")" ]
   IDENT="$(grep "reated new database" "$TEST_OUT" | awk 'NF>1{print $NF}')"
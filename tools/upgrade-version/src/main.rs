@@ -25,9 +25,15 @@ static IGNORE_FILES: [&str; 5] = [
     "crates/testing/Cargo.toml",
 ];
 
+// Build output and package caches never hold manifests we want to bump, and can be huge.
+static SKIP_DIRS: [&str; 5] = ["target", "node_modules", ".git", "bin", "obj"];
+
 fn find_files(start_dir: &str, name: &str) -> Vec<String> {
     let mut files = Vec::new();
-    for entry in WalkDir::new(start_dir).into_iter().filter_map(|e| e.ok()) {
+    let walker = WalkDir::new(start_dir)
+        .into_iter()
+        .filter_entry(|e| !(e.file_type().is_dir() && SKIP_DIRS.iter().any(|dir| e.file_name() == OsStr::new(dir))));
+    for entry in walker.filter_map(|e| e.ok()) {
         if entry.file_type().is_file() && entry.path().file_name() == Some(OsStr::new(name)) {
             if IGNORE_FILES.contains(&entry.path().to_string_lossy().as_ref()) {
                 continue;
@@ -43,14 +49,13 @@ enum FileProcessState {
     Dependencies,
 }
 
-fn process_crate_toml(path: &PathBuf, upgrade_version: &str, upgrade_package_version: bool) {
+fn process_crate_toml(path: &PathBuf, upgrade_version: &str, upgrade_package_version: bool, re: &Regex) {
     println!("Processing file: {}", path.to_string_lossy());
 
     let file = File::open(path).unwrap_or_else(|_| panic!("File not found: {}", path.to_string_lossy()));
     let reader = BufReader::new(file);
     let mut temp_file = NamedTempFile::new().expect("Failed to create temporary file!");
     let mut state = FileProcessState::Package;
-    let re = Regex::new(r#"(version = ")([^"]+)"#).unwrap();
 
     for line_result in reader.lines() {
         match line_result {
@@ -149,17 +154,20 @@ fn main() {
         return;
     }
 
+    // Compiled once and shared by every manifest we rewrite.
+    let version_re = Regex::new(r#"(version = ")([^"]+)"#).unwrap();
+
     for file in find_files("crates", "Cargo.toml") {
-        process_crate_toml(&PathBuf::from(file), version, true);
+        process_crate_toml(&PathBuf::from(file), version, true, &version_re);
     }
     for file in find_files("modules", "Cargo.toml") {
-        process_crate_toml(&PathBuf::from(file), version, false);
+        process_crate_toml(&PathBuf::from(file), version, false, &version_re);
     }
     for file in find_files("crates", "Cargo._toml") {
-        process_crate_toml(&PathBuf::from(file), version, false);
+        process_crate_toml(&PathBuf::from(file), version, false, &version_re);
     }
 
-    process_crate_toml(&PathBuf::from("crates/testing/Cargo.toml"), version, false);
+    process_crate_toml(&PathBuf::from("crates/testing/Cargo.toml"), version, false, &version_re);
     process_license_file(version);
     cmd!("cargo", "check").run().expect("Cargo check failed!");
 }